@@ -1,18 +1,44 @@
-from typing import Any, ClassVar, Dict, Set, Union
+import sys
+from typing import Any, ClassVar, Dict, Optional, Set, Union
 
 from pydantic import BaseModel
 
 
 class Annotation(BaseModel):
+    # The precalculated hash is stored in a slot instead of a pydantic
+    # private attribute. Annotations are hashed every time they are added
+    # to or looked up in the annotation sets of HPOTerms
+    __slots__ = ("_hash",)
+
     id: int
     name: str
     hpo: Set[int] = set()
-    _hash: int
-    _json_keys = set(["id", "name"])
+    _json_keys: ClassVar[Set[str]] = set(["id", "name"])
 
     def __init__(self, **kwargs: Union[int, str]) -> None:
         super().__init__(**kwargs)
-        self._hash = hash((self.id, self.name))
+        self._hash: int = hash((self.id, self.name))
+
+    def __copy__(self) -> "Annotation":
+        annotation = super().__copy__()
+        object.__setattr__(annotation, "_hash", self._hash)
+        return annotation
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "Annotation":
+        annotation = super().__deepcopy__(memo)
+        object.__setattr__(annotation, "_hash", self._hash)
+        return annotation
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        # pydantic only pickles the fields, but not the slots
+        state = super().__getstate__()
+        state["_hash"] = self._hash
+        return state
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        _hash = state.pop("_hash")
+        super().__setstate__(state)
+        object.__setattr__(self, "_hash", _hash)
 
     def toJSON(self, verbose: bool = False) -> dict:
         """
@@ -43,6 +69,11 @@ class Annotation(BaseModel):
         return res
 
     def __eq__(self, other: Any) -> bool:
+        # Annotations are singletons, so most comparisons
+        # are between the very same object
+        if self is other:
+            return True
+
         if isinstance(other, int):
             return self.id == other
 
@@ -90,7 +121,7 @@ class GeneSingleton(Annotation):
         HGNC gene synbol
     """
 
-    _json_keys = set(["id", "name", "symbol"])
+    _json_keys: ClassVar[Set[str]] = set(["id", "name", "symbol"])
 
     @property
     def symbol(self) -> str:
@@ -146,15 +177,15 @@ class GeneDict(dict):
         self._names: Dict[str, GeneSingleton] = {}
 
     def __call__(self, hgncid: int, symbol: str) -> GeneSingleton:
-        try:
-            return self._names[symbol]
-        except KeyError:
-            pass
-        try:
-            return self._indicies[hgncid]
-        except KeyError:
-            pass
-
+        # A single probe per dict, without raising and catching
+        # KeyErrors for every new gene
+        gene = self._names.get(symbol)
+        if gene is None:
+            gene = self._indicies.get(hgncid)
+        if gene is not None:
+            return gene
+
+        symbol = sys.intern(symbol)
         gene = GeneSingleton(id=hgncid, name=symbol)  # type: ignore
 
         self[gene] = gene
@@ -196,6 +227,13 @@ class GeneDict(dict):
         GeneSingleton
             If a gene is found, it is returned. Otherwise an Error is raised
         """
+        if isinstance(query, str) and not query.isdigit():
+            # Gene symbols are the most common queries. Look them up
+            # directly instead of failing to parse them as HGNC ID first
+            gene = self._names.get(query)
+            if gene is not None:
+                return gene
+
         try:
             idx: int = int(query)
             return self._indicies[idx]
@@ -308,12 +346,11 @@ class DiseaseDict(dict):
 
     def __call__(self, diseaseid: int, name: str) -> DiseaseSingleton:
         assert self.disease_class
-        try:
-            return self._indicies[diseaseid]
-        except KeyError:
-            pass
+        disease: Optional[DiseaseSingleton] = self._indicies.get(diseaseid)
+        if disease is not None:
+            return disease
 
-        disease: DiseaseSingleton = self.disease_class(id=diseaseid, name=name)
+        disease = self.disease_class(id=diseaseid, name=name)
 
         self[disease] = disease
         self._indicies[diseaseid] = disease
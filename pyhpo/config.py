@@ -1,5 +1,5 @@
 # Possible values for Boolean truth checking
-TRUTH = ("true", "t", "yes", "y", "1")
+TRUTH = frozenset(("true", "t", "yes", "y", "1"))
 
 # Parent HPO-Term IDs of modifier terms
-MODIFIER_IDS = {5, 12823, 40279, 31797, 32223, 32443}
+MODIFIER_IDS = frozenset((5, 12823, 40279, 31797, 32223, 32443))
@@ -156,20 +156,22 @@ class Matrix:
             yield self[None, x]
 
     def __str__(self) -> str:
-        maxlength = max([len(str(self.n_cols))] + [len(str(x)) for x in self._data]) + 2
+        cells = [str(x) for x in self._data]
+        maxlength = max([len(str(self.n_cols))] + [len(x) for x in cells]) + 2
         idxlength = len(str(self.n_rows)) + 2
 
-        s = ""
-
-        s += "{}||".format("".rjust(idxlength))
-        s += "".join(
+        header = "{}||".format("".rjust(idxlength)) + "".join(
             ["{}|".format(str(x).rjust(maxlength)) for x in range(self.n_cols)]
         )
-        s += "\n" + "=" * len(s)
 
-        for idx, item in enumerate(self._data):
+        # Collect all parts and join them once at the end instead of
+        # growing a string, which can copy everything built so far per cell
+        parts = [header, "\n" + "=" * len(header)]
+        for idx, cell in enumerate(cells):
             if idx % self.n_cols == 0:
-                s += "\n{}||".format(str(int(idx / self.n_cols)).ljust(idxlength))
-            s += "{}|".format(str(item).rjust(maxlength))
+                parts.append(
+                    "\n{}||".format(str(int(idx / self.n_cols)).ljust(idxlength))
+                )
+            parts.append("{}|".format(cell.rjust(maxlength)))
 
-        return s
+        return "".join(parts)
@@ -1,6 +1,7 @@
 import os
 import math
 import warnings
+from collections import deque
 from typing import List, Set, Tuple, Optional, Union, Dict, Iterator
 
 try:
@@ -378,15 +379,35 @@ class OntologyClass:
         Called by default after loading the ontology from a file
         """
         for term in self._map.values():
-            for parent_id in term.parent_ids():
+            for parent_id in term._parent_ids:
                 parent = self[parent_id]
                 term.parents.add(parent)
                 parent.children.add(term)
 
-        # Build caches of hierarchy to speed up performance
-        for term in self._map.values():
+        # Build the cache of all ancestors to speed up performance.
+        # Parents are always processed before their children,
+        # so every term builds its cache based on its parents' cache.
+        # The full ``hierarchy`` of all paths is only needed for a few
+        # path-length queries and is built lazily on first access.
+        for term in self._topological_order():
             term.all_parents
 
+    def _topological_order(self) -> Iterator[HPOTerm]:
+        """
+        Yields all HPO terms of the Ontology in topological order,
+        i.e. every term is yielded only after all of its parents
+        (Kahn's algorithm)
+        """
+        pending = {term: len(term.parents) for term in self._map.values()}
+        queue = deque(term for term, n_parents in pending.items() if not n_parents)
+        while queue:
+            term = queue.popleft()
+            yield term
+            for child in term.children:
+                pending[child] -= 1
+                if not pending[child]:
+                    queue.append(child)
+
     def _add_information_content(self) -> None:
         """
         Calculates the information content for each HPO Term
@@ -6,6 +6,7 @@ from pyhpo.annotations import DiseaseDict
 from pyhpo.annotations import Decipher, Omim, Orpha
 from pyhpo.annotations import DecipherDisease, OmimDisease, OrphaDisease
 from pyhpo.parser.generics import id_from_string, remove_outcommented_rows
+from pyhpo.parser.generics import _propagate
 import pyhpo
 
 
@@ -53,27 +54,24 @@ def _parse_phenotype_hpoa_file(path: str) -> None:
 
 def _add_decipher_to_ontology(ontology: "pyhpo.OntologyClass") -> None:
     ontology._decipher_diseases = all_decipher_diseases()
+    _propagate(ontology, ontology._decipher_diseases, "decipher_diseases")
     for decipher in ontology._decipher_diseases:
-        for term_id in decipher.hpo:
-            add_decipher_to_term(decipher, ontology[term_id])
         for term_id in decipher.negative_hpo:
             add_negative_decipher_to_term(decipher, ontology[term_id])
 
 
 def _add_omim_to_ontology(ontology: "pyhpo.OntologyClass") -> None:
     ontology._omim_diseases = all_omim_diseases()
+    _propagate(ontology, ontology._omim_diseases, "omim_diseases")
     for omim in ontology._omim_diseases:
-        for term_id in omim.hpo:
-            add_omim_to_term(omim, ontology[term_id])
         for term_id in omim.negative_hpo:
             add_negative_omim_to_term(omim, ontology[term_id])
 
 
 def _add_orpha_to_ontology(ontology: "pyhpo.OntologyClass") -> None:
     ontology._orpha_diseases = all_orpha_diseases()
+    _propagate(ontology, ontology._orpha_diseases, "orpha_diseases")
     for orpha in ontology._orpha_diseases:
-        for term_id in orpha.hpo:
-            add_orpha_to_term(orpha, ontology[term_id])
         for term_id in orpha.negative_hpo:
             add_negative_orpha_to_term(orpha, ontology[term_id])
 
@@ -82,8 +80,10 @@ def add_decipher_to_term(
     decipher: "pyhpo.annotations.DecipherDisease", term: "pyhpo.HPOTerm"
 ) -> None:
     """
-    Recursive function to add Decipher Disease
-    to an HPOTerm and all its parents
+    Adds Decipher Disease to an HPOTerm and all its parents
+
+    The ancestors are taken from the cached ``all_parents``
+    of the term, so no recursion through the ontology is needed.
 
     Parameters
     ----------
@@ -95,8 +95,8 @@ def add_decipher_to_term(
     if decipher in term.decipher_diseases:
         return None
     term.decipher_diseases.add(decipher)
-    for parent in term.parents:
-        add_decipher_to_term(decipher, parent)
+    for parent in term.all_parents:
+        parent.decipher_diseases.add(decipher)
     return None
 
 
@@ -104,8 +104,10 @@ def add_negative_decipher_to_term(
     decipher: "pyhpo.annotations.DecipherDisease", term: "pyhpo.HPOTerm"
 ) -> None:
     """
-    Recursive function to add excluded Decipher Disease
-    to an HPOTerm and all its parents
+    Adds excluded Decipher Disease to an HPOTerm and all its children
+
+    The children are visited iteratively, so deep branches of
+    the ontology don't add to the recursion depth.
 
     Parameters
     ----------
@@ -114,11 +116,13 @@ def add_negative_decipher_to_term(
     term:
         HPOTerm that is not associated with diseease
     """
-    if decipher in term.decipher_excluded_diseases:
-        return None
-    term.decipher_excluded_diseases.add(decipher)
-    for child in term.children:
-        add_negative_decipher_to_term(decipher, child)
+    stack = [term]
+    while stack:
+        node = stack.pop()
+        if decipher in node.decipher_excluded_diseases:
+            continue
+        node.decipher_excluded_diseases.add(decipher)
+        stack.extend(node.children)
     return None
 
 
@@ -126,8 +130,10 @@ def add_omim_to_term(
     omim: "pyhpo.annotations.OmimDisease", term: "pyhpo.HPOTerm"
 ) -> None:
     """
-    Recursive function to add OMIM Disease
-    to an HPOTerm and all its parents
+    Adds OMIM Disease to an HPOTerm and all its parents
+
+    The ancestors are taken from the cached ``all_parents``
+    of the term, so no recursion through the ontology is needed.
 
     Parameters
     ----------
@@ -139,8 +145,8 @@ def add_omim_to_term(
     if omim in term.omim_diseases:
         return None
     term.omim_diseases.add(omim)
-    for parent in term.parents:
-        add_omim_to_term(omim, parent)
+    for parent in term.all_parents:
+        parent.omim_diseases.add(omim)
     return None
 
 
@@ -148,8 +154,10 @@ def add_negative_omim_to_term(
     omim: "pyhpo.annotations.OmimDisease", term: "pyhpo.HPOTerm"
 ) -> None:
     """
-    Recursive function to add excluded OMIM Disease
-    to an HPOTerm and all its parents
+    Adds excluded OMIM Disease to an HPOTerm and all its children
+
+    The children are visited iteratively, so deep branches of
+    the ontology don't add to the recursion depth.
 
     Parameters
     ----------
@@ -158,11 +166,13 @@ def add_negative_omim_to_term(
     term:
         HPOTerm that is not associated with diseease
     """
-    if omim in term.omim_excluded_diseases:
-        return None
-    term.omim_excluded_diseases.add(omim)
-    for child in term.children:
-        add_negative_omim_to_term(omim, child)
+    stack = [term]
+    while stack:
+        node = stack.pop()
+        if omim in node.omim_excluded_diseases:
+            continue
+        node.omim_excluded_diseases.add(omim)
+        stack.extend(node.children)
     return None
 
 
@@ -170,8 +180,10 @@ def add_orpha_to_term(
     orpha: "pyhpo.annotations.OrphaDisease", term: "pyhpo.HPOTerm"
 ) -> None:
     """
-    Recursive function to add Orpha Disease
-    to an HPOTerm and all its parents
+    Adds Orpha Disease to an HPOTerm and all its parents
+
+    The ancestors are taken from the cached ``all_parents``
+    of the term, so no recursion through the ontology is needed.
 
     Parameters
     ----------
@@ -183,8 +195,8 @@ def add_orpha_to_term(
     if orpha in term.orpha_diseases:
         return None
     term.orpha_diseases.add(orpha)
-    for parent in term.parents:
-        add_orpha_to_term(orpha, parent)
+    for parent in term.all_parents:
+        parent.orpha_diseases.add(orpha)
     return None
 
 
@@ -192,8 +204,10 @@ def add_negative_orpha_to_term(
     orpha: "pyhpo.annotations.OrphaDisease", term: "pyhpo.HPOTerm"
 ) -> None:
     """
-    Recursive function to add excluded Orpha Disease
-    to an HPOTerm and all its parents
+    Adds excluded Orpha Disease to an HPOTerm and all its children
+
+    The children are visited iteratively, so deep branches of
+    the ontology don't add to the recursion depth.
 
     Parameters
     ----------
@@ -202,11 +216,13 @@ def add_negative_orpha_to_term(
     term:
         HPOTerm that is not associated with diseease
     """
-    if orpha in term.orpha_excluded_diseases:
-        return None
-    term.orpha_excluded_diseases.add(orpha)
-    for child in term.children:
-        add_negative_orpha_to_term(orpha, child)
+    stack = [term]
+    while stack:
+        node = stack.pop()
+        if orpha in node.orpha_excluded_diseases:
+            continue
+        node.orpha_excluded_diseases.add(orpha)
+        stack.extend(node.children)
     return None
 
 
@@ -4,9 +4,17 @@ They used to be part of HPOTerm, but refactored out to
 have a leander HPOTerm class
 """
 
-from typing import Iterator
+from collections import defaultdict
+from functools import lru_cache
+from typing import DefaultDict, Dict, Iterable, Iterator, Set, TypeVar
 
+from pyhpo.annotations import Annotation
+import pyhpo
 
+A = TypeVar("A", bound=Annotation)
+
+
+@lru_cache(maxsize=8192)
 def id_from_string(hpo_string: str) -> int:
     """
     Formats the HPO-type Term-ID into an integer id
@@ -25,9 +33,18 @@ def id_from_string(hpo_string: str) -> int:
 
         (e.g.: 1)
 
+    .. note::
+
+        The annotation files contain the same HPO IDs many times,
+        so the most recent results are cached. The input strings
+        can contain more than the ID (e.g. ``HP:0000001 ! All``),
+        so the cache is bounded.
+
     """
-    idx = hpo_string.split("!")[0].strip()
-    return int(idx.split(":")[1].strip())
+    # int() ignores surrounding whitespace and line breaks, so the
+    # ID part does not have to be stripped explicitly
+    idx = hpo_string.split("!", 1)[0]
+    return int(idx.split(":", 1)[1])
 
 
 def remove_outcommented_rows(fh: Iterator[str], ignorechar: str = "#") -> Iterator[str]:
@@ -54,3 +71,46 @@ def remove_outcommented_rows(fh: Iterator[str], ignorechar: str = "#") -> Iterat
     for row in fh:
         if row[0:len_check] != ignorechar:
             yield row
+
+
+def _group_by_term(
+    ontology: "pyhpo.OntologyClass", annotations: Iterable[A]
+) -> Dict["pyhpo.HPOTerm", Set[A]]:
+    """
+    Groups the annotations (genes or diseases) by their directly
+    associated HPOTerms
+
+    This allows adding all annotations of one term to its ancestors
+    in bulk, instead of adding every annotation to every ancestor
+    one by one.
+    """
+    # Group by the integer IDs first. They hash in C, while the
+    # ontology lookup and HPOTerm hashing run only once per term
+    by_id: DefaultDict[int, Set[A]] = defaultdict(set)
+    for annotation in annotations:
+        for term_id in annotation.hpo:
+            by_id[term_id].add(annotation)
+    return {ontology[term_id]: items for term_id, items in by_id.items()}
+
+
+def _propagate(
+    ontology: "pyhpo.OntologyClass", annotations: Iterable[A], attr: str
+) -> None:
+    """
+    Adds the annotations to their directly associated HPOTerms
+    and to all ancestors of those terms
+
+    Parameters
+    ----------
+    ontology:
+        The ontology containing the annotated terms
+    annotations:
+        Genes or diseases
+    attr:
+        Name of the HPOTerm attribute holding the annotations
+        (e.g. ``genes`` or ``omim_diseases``)
+    """
+    for term, items in _group_by_term(ontology, annotations).items():
+        getattr(term, attr).update(items)
+        for parent in term.all_parents:
+            getattr(parent, attr).update(items)
@@ -4,6 +4,7 @@ from typing import Set
 
 from pyhpo.annotations import Gene, GeneSingleton
 from pyhpo.parser.generics import id_from_string, remove_outcommented_rows
+from pyhpo.parser.generics import _propagate
 import pyhpo
 
 
@@ -29,16 +30,17 @@ def _parse_phenotype_to_gene_file(path: str) -> None:
 
 def _add_genes_to_ontology(ontology: "pyhpo.OntologyClass") -> None:
     ontology._genes = all_genes()
-    for gene in ontology._genes:
-        for term_id in gene.hpo:
-            add_gene_to_term(gene, ontology[term_id])
+    _propagate(ontology, ontology._genes, "genes")
 
 
 def add_gene_to_term(
     gene: "pyhpo.annotations.GeneSingleton", term: "pyhpo.HPOTerm"
 ) -> None:
     """
-    Recursive function to add Gene to an HPOTerm and all its parents
+    Adds Gene to an HPOTerm and all its parents
+
+    The ancestors are taken from the cached ``all_parents``
+    of the term, so no recursion through the ontology is needed.
 
     Parameters
     ----------
@@ -50,8 +52,8 @@ def add_gene_to_term(
     if gene in term.genes:
         return None
     term.genes.add(gene)
-    for parent in term.parents:
-        add_gene_to_term(gene, parent)
+    for parent in term.all_parents:
+        parent.genes.add(gene)
     return None
 
 
@@ -3,13 +3,18 @@ Parse the OBO flat-file
 """
 
 import os
-from typing import Callable, Dict, Iterator, List
+import re
+from collections import defaultdict
+from typing import Callable, DefaultDict, Dict, Iterator, List
 
 from pyhpo.config import TRUTH
 
 
 FILENAME = "hp.obo"
 
+# Quoted OBO strings can contain escaped quotes
+QUOTED_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
 
 class Metadata:
     format_version: str
@@ -61,7 +66,18 @@ class Converter:
 
             e.g.: Multicystic dysplastic kidney
         """
-        return [x.split('"')[1] for x in value]
+        return [Converter._unquote(x) for x in value]
+
+    @staticmethod
+    def _unquote(line: str) -> str:
+        res = line.split('"', 2)[1]
+        if "\\" in res:
+            # The string contains escaped characters and the split
+            # might have stopped too early at an escaped quote
+            match = QUOTED_STRING.search(line)
+            if match:
+                res = re.sub(r"\\(.)", r"\1", match.group(1))
+        return res
 
 
 Converter.add_type_conversion("id", Converter.array_to_str)
@@ -124,17 +140,13 @@ def parse_obo_section(term_section: List[str]) -> dict:
     term_section:
         Lines of the ``obo`` file that describe the HPO term
     """
-    term_data = {}
+    term_data: DefaultDict[str, List[str]] = defaultdict(list)
     for line in term_section:
-        if line == "":
-            continue
-        key, value = line.split(":", 1)
-        if key not in term_data:
-            term_data[key] = [value.strip()]
-        else:
+        if line:
+            key, value = line.split(":", 1)
             term_data[key].append(value.strip())
-    term_dict = _convert_dict_keys(term_data)
-    term_dict = _convert_value_types(term_data)
+    term_dict = _convert_dict_keys(dict(term_data))
+    term_dict = _convert_value_types(term_dict)
     return term_dict
 
 
@@ -1,11 +1,31 @@
 import warnings
-from typing import Iterable, Set, List, Iterator, Union, Tuple
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Set, List, Iterator, Union, Tuple
 
 import pyhpo
 from pyhpo.ontology import Ontology
 from pyhpo.matrix import Matrix
 
 
+def _fun_sim_avg(row_maxes: List[float], col_maxes: List[float]) -> float:
+    return (sum(row_maxes) / len(row_maxes) + sum(col_maxes) / len(col_maxes)) / 2
+
+
+def _fun_sim_max(row_maxes: List[float], col_maxes: List[float]) -> float:
+    return max([sum(row_maxes) / len(row_maxes), sum(col_maxes) / len(col_maxes)])
+
+
+def _bma(row_maxes: List[float], col_maxes: List[float]) -> float:
+    return (sum(row_maxes) + sum(col_maxes)) / (len(row_maxes) + len(col_maxes))
+
+
+COMBINE_METHODS: Dict[str, Callable[[List[float], List[float]], float]] = {
+    "funSimAvg": _fun_sim_avg,
+    "funSimMax": _fun_sim_max,
+    "BMA": _bma,
+}
+
+
 class HPOSet(set):
     def __init__(self, items: Iterable["pyhpo.HPOTerm"]) -> None:
         set.__init__(self, items)
@@ -379,25 +399,15 @@ class HPOSet(set):
         col_maxes = [max([v for v in col]) for col in score_matrix.columns]
 
         try:
-            if combine == "funSimAvg":
-                return (
-                    sum(row_maxes) / len(row_maxes) + sum(col_maxes) / len(col_maxes)
-                ) / 2
-
-            if combine == "funSimMax":
-                return max(
-                    [sum(row_maxes) / len(row_maxes), sum(col_maxes) / len(col_maxes)]
-                )
-
-            if combine == "BMA":
-                return (sum(row_maxes) + sum(col_maxes)) / (
-                    len(row_maxes) + len(col_maxes)
-                )
+            combine_scores = COMBINE_METHODS[combine]
+        except KeyError as err:
+            raise RuntimeError("Invalid combine method specified") from err
+
+        try:
+            return combine_scores(row_maxes, col_maxes)
         except ZeroDivisionError:
             return 0
 
-        raise RuntimeError("Invalid combine method specified")
-
     def _equality_score(self, other: "HPOSet") -> float:
         """
         Returns an equality similarity score.
@@ -423,11 +433,10 @@ class HPOSet(set):
         if not len(self) or not len(other):
             return 0
 
-        matches = 0
-        for term1 in self:
-            for term2 in other:
-                if term1 == term2:
-                    matches += 1
+        # Every term is present only once in each set, so the number
+        # of exact matches is the size of the intersection. ``&`` iterates
+        # the smaller set and looks up each term in the larger one.
+        matches = len(self & other)
         return matches / max([len(self), len(other)])
 
     @staticmethod
@@ -467,10 +476,11 @@ class HPOSet(set):
         if not len(set1) or not len(set2):
             return Matrix(0, 0)
 
-        scores = []
-        for set1_term in set1:
-            for set2_term in set2:
-                scores.append(set1_term.similarity_score(set2_term, kind, method))
+        scores = [
+            set1_term.similarity_score(set2_term, kind, method)
+            for set1_term in set1
+            for set2_term in set2
+        ]
 
         return Matrix(len(set1), len(set2), scores)
 
@@ -538,7 +548,7 @@ class HPOSet(set):
             A string representation of the HPOSet
 
         """
-        ids = [str(x) for x in sorted([int(x) for x in self])]
+        ids = [str(x) for x in sorted(map(attrgetter("index"), self))]
         return "+".join(ids)
 
     def toJSON(self, verbose: bool = False) -> List[dict]:
@@ -559,14 +569,11 @@ class HPOSet(set):
         return [t.toJSON(verbose) for t in self._list]
 
     def __str__(self) -> str:
-        return "{}: {}".format(
-            self.__class__.__name__, ", ".join([x.name for x in self._list])
-        )
+        names = ", ".join([x.name for x in self._list])
+        return f"{self.__class__.__name__}: {names}"
 
     def __repr__(self) -> str:
-        return '{}.from_serialized("{}")'.format(
-            self.__class__.__name__, self.serialize()
-        )
+        return f'{self.__class__.__name__}.from_serialized("{self.serialize()}")'
 
 
 class BasicHPOSet(HPOSet):
@@ -19,6 +19,25 @@ class _Similarity(BaseModel):
     ) -> float:
         kind = kind or self.kind
         method = method or self.method
+        return self._calculate(term1, term2, kind, method, {})
+
+    def _calculate(
+        self,
+        term1: "pyhpo.HPOTerm",
+        term2: "pyhpo.HPOTerm",
+        kind: str,
+        method: str,
+        memo: Dict[str, float],
+    ) -> float:
+        """
+        Calculates the similarity score and all its dependencies
+
+        ``memo`` holds the results of all dependencies that were already
+        calculated for this term-pair. Several methods share the same
+        dependencies (e.g. ``rel`` depends on ``resnik`` and on ``lin``,
+        which depends on ``resnik`` again), so every dependency is only
+        calculated once per pair.
+        """
         try:
             similarity = self.dispatch[method]
         except KeyError as err:
@@ -26,9 +45,17 @@ class _Similarity(BaseModel):
                 f"Unknown method {method} to calculate similarity"
             ) from err
 
-        dependencies: List[float] = [
-            self(term1, term2, kind, dep) for dep in similarity.dependencies
-        ]
+        if not similarity.dependencies:
+            # Most methods are leaf calculations without dependencies.
+            # Skip the recursive dispatch for them, since this is
+            # called for every single term-pair
+            return similarity(term1, term2, kind, [])
+
+        dependencies: List[float] = []
+        for dep in similarity.dependencies:
+            if dep not in memo:
+                memo[dep] = self._calculate(term1, term2, kind, dep, memo)
+            dependencies.append(memo[dep])
 
         return similarity(term1, term2, kind, dependencies)
 
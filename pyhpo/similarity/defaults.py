@@ -104,7 +104,8 @@ class Relevance(SimilarityBase):
         kind: str,
         dependencies: List[float],
     ) -> float:
-        return dependencies[1] * (1 - (math.exp(dependencies[0] * -1)))
+        # expm1 is more precise than 1 - exp() for small values
+        return dependencies[1] * -math.expm1(-dependencies[0])
 
 
 class InformationCoefficient(SimilarityBase):
@@ -123,7 +124,8 @@ class InformationCoefficient(SimilarityBase):
         kind: str,
         dependencies: List[float],
     ) -> float:
-        return dependencies[1] * (1 - (1 / (1 + dependencies[0])))
+        # Same as lin * (1 - (1 / (1 + mica)))
+        return dependencies[1] * dependencies[0] / (1 + dependencies[0])
 
 
 class GraphIC(SimilarityBase):
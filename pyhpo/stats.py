@@ -1,3 +1,5 @@
+from collections import Counter
+from operator import attrgetter, itemgetter
 from typing import Callable, Dict, List, Union, Tuple
 
 try:
@@ -119,7 +121,7 @@ class HPOEnrichment:
             for hpo, count in list_counts.items()
         ]
 
-        return sorted(res, key=lambda x: x["enrichment"])
+        return sorted(res, key=itemgetter("enrichment"))
 
     def _hpo_count(self, annotation_sets: List["pyhpo.Annotation"]) -> Tuple[dict, int]:
         """
@@ -140,13 +142,11 @@ class HPOEnrichment:
                 * value: int <Number of occurences>
             * Total number of HPO terms in set
         """
-        hpos = {}
+        hpos: Counter = Counter()
         for item in annotation_sets:
-            for term in item.hpo:
-                if term not in hpos:
-                    hpos[term] = 0
-                hpos[term] += 1
-        return (hpos, sum(hpos.values()))
+            hpos.update(item.hpo)
+        # Return a plain dict, so that missing items raise a KeyError
+        return (dict(hpos), sum(hpos.values()))
 
     def _single_enrichment(
         self,
@@ -216,10 +216,10 @@ class EnrichmentModel:
     """
 
     attribute_lookup: Dict[str, Callable] = {
-        "gene": lambda x: x.genes,
-        "omim": lambda x: x.omim_diseases,
-        "orpha": lambda x: x.orpha_diseases,
-        "decipher": lambda x: x.decipher_diseases,
+        "gene": attrgetter("genes"),
+        "omim": attrgetter("omim_diseases"),
+        "orpha": attrgetter("orpha_diseases"),
+        "decipher": attrgetter("decipher_diseases"),
     }
 
     def __init__(self, category: str) -> None:
@@ -259,7 +259,7 @@ class EnrichmentModel:
             }
             for item, count in list_counts.items()
         ]
-        return sorted(res, key=lambda x: x["enrichment"])
+        return sorted(res, key=itemgetter("enrichment"))
 
     def _population_count(self, hopset: HPOSet) -> Tuple[dict, int]:
         """
@@ -278,13 +278,11 @@ class EnrichmentModel:
                 * value: int <Number of occurences>
             * Total number of annotations in set
         """
-        population = {}
+        population: Counter = Counter()
         for term in hopset:
-            for item in self.attribute(term):
-                if item not in population:
-                    population[item] = 0
-                population[item] += 1
-        return population, sum(population.values())
+            population.update(self.attribute(term))
+        # Return a plain dict, so that missing items raise a KeyError
+        return dict(population), sum(population.values())
 
     def _single_enrichment(
         self, method: str, item_id: int, positives: int, samples: int
@@ -1,5 +1,7 @@
-from operator import or_
-from functools import reduce, lru_cache
+from collections import deque
+from copy import deepcopy
+from functools import lru_cache
+import sys
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
@@ -42,8 +44,11 @@ class InformationContent(BaseModel):
 
         """
         try:
-            return float(self.__getattribute__(key))
-        except AttributeError as err:
+            # The fields are stored in the instance ``__dict__``. Reading
+            # them directly bypasses the attribute lookup machinery, since
+            # this is called for every term in all similarity calculations
+            return float(self.__dict__[key])
+        except KeyError as err:
             if key in self.custom:
                 return self.custom[key]
             else:
@@ -85,6 +90,12 @@ class HPOTerm(BaseModel):
     An HPOTerm instance should always be derived from the :class:`pyhpo.Ontology`
     """
 
+    # Pydantic keeps all fields in the instance ``__dict__``, but the
+    # non-field attributes are stored in slots. This avoids a separate
+    # ``__pydantic_private__`` dict for every term and the slow lookup
+    # through ``BaseModel.__getattr__`` on every access
+    __slots__ = ("_is_a", "_parent_ids")
+
     ###
     # Always present and mandatory
     ###
@@ -108,8 +119,6 @@ class HPOTerm(BaseModel):
     The integer representation of the HPO identifier
     """
 
-    _hash: int
-
     ###
     # Mandatory for HPOTerm, but not always present in input
     ###
@@ -124,14 +133,13 @@ class HPOTerm(BaseModel):
     The definition from the OBO source file
     """
 
-    _is_a: List[str] = []
-    synonym: List[str] = []
+    synonym: List[str] = Field(default_factory=list)
     """
     A list of synonymous names for the term
     """
 
-    xref: List[str] = []
-    alt_id: List[str] = []
+    xref: List[str] = Field(default_factory=list)
+    alt_id: List[str] = Field(default_factory=list)
 
     ###
     # Special logic for some obsolete terms
@@ -139,65 +147,65 @@ class HPOTerm(BaseModel):
 
     is_obsolete: bool = False
     replaced_by: Optional[str] = None
-    consider: List[str] = []
+    consider: List[str] = Field(default_factory=list)
 
     ###
     # Computed once all HPO Terms are present in the Ontology
     ###
 
-    parents: Set["HPOTerm"] = set()
+    parents: Set["HPOTerm"] = Field(default_factory=set)
     """
     A set of all direct parent terms
     """
 
-    children: Set["HPOTerm"] = set()
+    children: Set["HPOTerm"] = Field(default_factory=set)
     """
     A set of all direct child terms
     """
 
-    genes: Set[GeneSingleton] = set()
+    genes: Set[GeneSingleton] = Field(default_factory=set)
     """
     A set of all associated genes. Associated genes are inversely inherited from
     child terms as well
     """
 
-    omim_diseases: Set[OmimDisease] = set()
+    omim_diseases: Set[OmimDisease] = Field(default_factory=set)
     """
     A set of all associated Omim diseases. Associated diseases are inversely inherited from
     child terms as well
     """
 
-    omim_excluded_diseases: Set[OmimDisease] = set()
+    omim_excluded_diseases: Set[OmimDisease] = Field(default_factory=set)
     """
     A set of all explicitly non-associated Omim diseases. Non-associated diseases are inherited from
     parent terms as well
     """
 
-    orpha_diseases: Set[OrphaDisease] = set()
+    orpha_diseases: Set[OrphaDisease] = Field(default_factory=set)
     """
     A set of all associated Orpha diseases. Associated diseases are inversely inherited from
     child terms as well
     """
 
-    orpha_excluded_diseases: Set[OrphaDisease] = set()
+    orpha_excluded_diseases: Set[OrphaDisease] = Field(default_factory=set)
     """
     A set of all explicitly non-associated Orpha diseases.
     Non-associated diseases are inherited from parent terms as well
     """
 
-    decipher_diseases: Set[DecipherDisease] = set()
+    decipher_diseases: Set[DecipherDisease] = Field(default_factory=set)
     """
     A set of all associated Decipher diseases. Associated diseases are inversely inherited from
     child terms as well
     """
 
-    decipher_excluded_diseases: Set[DecipherDisease] = set()
+    decipher_excluded_diseases: Set[DecipherDisease] = Field(default_factory=set)
     """
     A set of all explicitly non-associated Decipher diseases.
     Non-associated diseases are inherited from parent terms as well
     """
 
-    information_content: InformationContent = InformationContent()
+    information_content: InformationContent = Field(default_factory=InformationContent)
     """
     The :class:`.InformationContent` of the HPO term.
     Multiple kinds of IC are automatically calculated,
@@ -206,15 +214,56 @@ class HPOTerm(BaseModel):
 
     def __init__(self, **kwargs) -> None:  # type: ignore
         kwargs["index"] = id_from_string(kwargs["id"])
+        kwargs["id"] = sys.intern(kwargs["id"])
         super().__init__(**kwargs)
-        self._hash = hash((self.index, self.name))
-        self._is_a = kwargs.get("is_a", [])
+        # The parent references never change after parsing, so they are
+        # stored in a compact tuple instead of the over-allocated list
+        self._is_a: Tuple[str, ...] = tuple(kwargs.get("is_a", ()))
+        # Duplicated ``is_a`` lines must not lead to duplicated parents
+        self._parent_ids: Tuple[int, ...] = tuple(
+            dict.fromkeys(id_from_string(item) for item in self._is_a)
+        )
+
+    def __copy__(self) -> "HPOTerm":
+        term = super().__copy__()
+        for attr in HPOTerm.__slots__:
+            object.__setattr__(term, attr, getattr(self, attr))
+        return term
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "HPOTerm":
+        term = super().__deepcopy__(memo)
+        for attr in HPOTerm.__slots__:
+            object.__setattr__(term, attr, deepcopy(getattr(self, attr), memo))
+        return term
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        # pydantic only pickles the fields, but not the slots
+        state = super().__getstate__()
+        state["__slots__"] = {attr: getattr(self, attr) for attr in HPOTerm.__slots__}
+        return state
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        slots = state.pop("__slots__", {})
+        super().__setstate__(state)
+        for attr, value in slots.items():
+            object.__setattr__(self, attr, value)
 
     @cached_property
     def all_parents(self) -> Set["HPOTerm"]:
-        hierarchy_set = reduce(or_, [set(path) for path in self.hierarchy])
-        hierarchy_set.remove(self)
-        return hierarchy_set
+        all_parents: Set["HPOTerm"] = set(self.parents)
+        for parent in self.parents:
+            all_parents.update(parent.all_parents)
+        return all_parents
+
+    @cached_property
+    def _ancestors_and_self(self) -> Set["HPOTerm"]:
+        """
+        Set of all ancestors, including the term itself
+
+        This is the basis for every similarity calculation. Caching it
+        avoids building two new sets for every pair of terms.
+        """
+        return self.all_parents | {self}
 
     @cached_property
     def hierarchy(self) -> Tuple[Tuple["HPOTerm", ...], ...]:
@@ -237,21 +286,53 @@ class HPOTerm(BaseModel):
         if not self.parents:
             return ((self,),)
 
-        paths: List[Tuple["HPOTerm", ...]] = []
-        for parent in self.parents:
-            for path in parent.hierarchy:
-                paths.append((self,) + path)
+        return tuple(
+            (self, *path) for parent in self.parents for path in parent.hierarchy
+        )
 
-        return tuple(paths)
+    @cached_property
+    def _dist_to_ancestor(self) -> Dict["HPOTerm", Tuple[int, Optional["HPOTerm"]]]:
+        """
+        Breadth-first search from the term upwards to the root
+
+        Returns a dict of the term itself and all its ancestors.
+        Every value is a tuple of the minimum number of steps to the
+        ancestor and the term from which the ancestor was first
+        reached, so that the shortest path can be reconstructed.
+        """
+        steps: Dict["HPOTerm", Tuple[int, Optional["HPOTerm"]]] = {self: (0, None)}
+        queue = deque([self])
+        while queue:
+            term = queue.popleft()
+            distance = steps[term][0] + 1
+            for parent in term.parents:
+                if parent not in steps:
+                    steps[parent] = (distance, term)
+                    queue.append(parent)
+        return steps
+
+    def _path_to_ancestor(self, ancestor: "HPOTerm") -> Tuple["HPOTerm", ...]:
+        """
+        Reconstructs the shortest path from the term to one of its ancestors
+        """
+        steps = self._dist_to_ancestor
+        path: List["HPOTerm"] = []
+        term: Optional["HPOTerm"] = ancestor
+        while term is not None:
+            path.append(term)
+            term = steps[term][1]
+        return tuple(reversed(path))
 
     @cached_property
     def is_modifier(self) -> bool:
-        return int(self) in MODIFIER_IDS or bool(
-            MODIFIER_IDS & {int(x) for x in self.all_parents}
+        # The flag of every parent is cached as well and already
+        # covers all of their own ancestors
+        return self.index in MODIFIER_IDS or any(
+            parent.is_modifier for parent in self.parents
         )
 
     def parent_ids(self) -> List[int]:
-        return [id_from_string(item) for item in self._is_a]
+        return list(self._parent_ids)
 
     def parent_of(self, other: "HPOTerm") -> bool:
         """
@@ -308,12 +389,9 @@ class HPOTerm(BaseModel):
         # Consider the following edge cases:
         # - self is in other.all_parents
         # - other is in self.all_parents
-        # To account for these edge cases,
-        # we first add self to self.all_parents
-        # and other to other.all_parents
-        self_ancestors: Set["HPOTerm"] = self.all_parents | set([self])
-        other_ancestors: Set["HPOTerm"] = other.all_parents | set([other])
-        return self_ancestors & other_ancestors
+        # To account for these edge cases, the intersection is based
+        # on the (cached) set of all_parents plus the term itself
+        return self._ancestors_and_self & other._ancestors_and_self
 
     def longest_path_to_root(self) -> int:
         """
@@ -324,7 +402,7 @@ class HPOTerm(BaseModel):
         int
             Maximum number of nodes until the root HPOTerm
         """
-        return max([len(h) - 1 for h in self.hierarchy])
+        return self._root_distances[1]
 
     def shortest_path_to_root(self) -> int:
         """
@@ -335,7 +413,23 @@ class HPOTerm(BaseModel):
         int
             Minimum number of nodes until the root HPOTerm
         """
-        return min([len(h) - 1 for h in self.hierarchy])
+        return self._root_distances[0]
+
+    @cached_property
+    def _root_distances(self) -> Tuple[int, int]:
+        """
+        The shortest and longest number of steps to the root term
+
+        Both are derived from the (cached) distances of the parents,
+        so the individual paths of the ``hierarchy`` are not needed.
+        """
+        if not self.parents:
+            return (0, 0)
+        distances = [parent._root_distances for parent in self.parents]
+        return (
+            min(shortest for shortest, _ in distances) + 1,
+            max(longest for _, longest in distances) + 1,
+        )
 
     def shortest_path_to_parent(
         self, other: "HPOTerm"
@@ -361,20 +455,15 @@ class HPOTerm(BaseModel):
         """
         if other not in self.all_parents and self != other:
             raise RuntimeError(f"{other.id} is not a parent of {self.id}")
-        return_tuples: List[Tuple[int, Tuple["HPOTerm", ...]]] = []
-        for path in self.hierarchy:
-            try:
-                i = path.index(other)
-                return_tuples.append((i, path[: i + 1]))
-            except ValueError:
-                pass
-
+        # The breadth-first distances to all ancestors are cached,
+        # so there is no need to scan every path of the hierarchy
         try:
-            return sorted(return_tuples, key=lambda x: x[0])[0]
-        except IndexError as err:
+            steps = self._dist_to_ancestor[other][0]
+        except KeyError as err:
             raise RuntimeError(
                 f"Unable to determine path to parent term {other.name}"
             ) from err
+        return (steps, self._path_to_ancestor(other))
 
     def longest_path_to_bottom(self, level: int = 0) -> int:
         """
@@ -423,29 +512,47 @@ class HPOTerm(BaseModel):
             Number of steps from term-2 to the common parent
 
         """
-        common = self.common_ancestors(other)
+        steps1 = self._dist_to_ancestor
+        steps2 = other._dist_to_ancestor
+        common = steps1.keys() & steps2.keys()
+        if not common:
+            raise IndexError(f"No common ancestor of {self.id} and {other.id}")
 
-        paths = []
-        for term in common:
-            path1 = self.shortest_path_to_parent(term)
-            path2 = other.shortest_path_to_parent(term)
+        best = min(common, key=lambda term: steps1[term][0] + steps2[term][0])
+        path1 = self._path_to_ancestor(best)
+        path2 = other._path_to_ancestor(best)
 
-            total_path = path1[1] + tuple(reversed(path2[1]))[1:]
-            paths.append(
-                (int(path1[0] + path2[0]), total_path, int(path1[0]), int(path2[0]))
-            )
-        return sorted(paths, key=lambda x: x[0])[0]
+        total_path = path1 + tuple(reversed(path2))[1:]
+        return (
+            steps1[best][0] + steps2[best][0],
+            total_path,
+            steps1[best][0],
+            steps2[best][0],
+        )
 
     def count_parents(self) -> int:
         """
-        Calculates total number of ancestral HPO Terms
+        Calculates the number of paths to all ancestral HPO Terms
+
+        An ancestor that can be reached via multiple paths is counted
+        once per path, so the result can be larger than the number
+        of distinct ancestors (``len(term.all_parents)``).
 
         Returns
         -------
         int
-            The number of all ancestral HPO Terms
+            The number of ancestral HPO Terms, counted once per path
         """
-        return sum([parent.count_parents() + 1 for parent in self.parents])
+        return self._parent_count
+
+    @cached_property
+    def _parent_count(self) -> int:
+        """
+        Ancestors that are reachable via multiple paths are counted once
+        per path. Caching the count of every term ensures that each term
+        is only calculated once, instead of once per path.
+        """
+        return sum([parent._parent_count + 1 for parent in self.parents])
 
     def similarity_score(
         self, other: "HPOTerm", kind: Optional[str] = None, method: Optional[str] = None
@@ -545,41 +652,52 @@ class HPOTerm(BaseModel):
             }
 
         """
-        res = {"int": int(self), "id": self.id, "name": self.name}
-
-        if verbose:
-            res["definition"] = self.definition
-            res["comment"] = self.comment
-            res["synonym"] = self.synonym
-            res["xref"] = self.xref
-            res["is_a"] = self._is_a
-            res["ic"] = self.information_content.model_dump()
+        if not verbose:
+            return {"int": self.index, "id": self.id, "name": self.name}
 
-        return res
+        return {
+            "int": self.index,
+            "id": self.id,
+            "name": self.name,
+            "definition": self.definition,
+            "comment": self.comment,
+            "synonym": self.synonym,
+            "xref": self.xref,
+            "is_a": list(self._is_a),
+            "ic": self.information_content.model_dump(),
+        }
 
     def to_obo(self) -> str:
         raise NotImplementedError("Method is missing")
 
     def __hash__(self) -> int:
         """
-        The hash is precalcuated during initialization
+        The integer index is unique for every HPO term and is used as hash
         """
-        return self._hash
+        return self.index
 
     def __int__(self) -> int:
         return self.index
 
     def __eq__(self, t2: Any) -> bool:
-        return hash(self) == hash(t2) and isinstance(t2, HPOTerm)
+        # Terms are unique within the Ontology, so most comparisons
+        # are between the very same object
+        if self is t2:
+            return True
+        if not isinstance(t2, HPOTerm):
+            return NotImplemented
+        return self.index == t2.index
 
     def __lt__(self, other: Any) -> bool:
-        return int(self) < int(other)
+        if isinstance(other, HPOTerm):
+            return self.index < other.index
+        return self.index < int(other)
 
     def __str__(self) -> str:
-        return "{} | {}".format(self.id, self.name)
+        return f"{self.id} | {self.name}"
 
     def __repr__(self) -> str:
-        return f"HPOTerm(id='{self.id}', name='{self.name}', " f"is_a={self._is_a})"
+        return f"HPOTerm(id='{self.id}', name='{self.name}', is_a={list(self._is_a)})"
 
     class Config:
         arbitrary_types_allowed = True
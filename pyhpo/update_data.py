@@ -1,6 +1,10 @@
 import os
+import shutil
 import urllib.request
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.error import HTTPError
 from typing import Optional
 
 from pyhpo.parser.obo import FILENAME as hpo_file
@@ -22,12 +26,31 @@ URLS = {
 
 FILENAMES = {"HPO_ONTOLOGY": hpo_file, "HPO_GENE": gene_file, "HPO_PHENO": pheno_file}
 
+# Buffer size for streaming the downloads to disk
+CHUNK_SIZE = 1 << 20
+
 
 def make_backup(filename: str) -> None:
     logger.debug("Backup not yet implemented")
 
 
-def download_data(data_dir: Optional[str] = None) -> None:
+def download_data(
+    data_dir: Optional[str] = None, only_if_modified: bool = False
+) -> None:
+    """
+    Downloads the HPO ontology and annotation files
+
+    Parameters
+    ----------
+    data_dir: str, default: ``None``
+        Path to the folder for the downloaded files.
+        Defaults to the ``data`` folder of the package
+    only_if_modified: bool, default: ``False``
+        Skip files that were not modified on the server since the
+        last download. This relies on the modification time of the
+        local files, so it should only be used if they were
+        downloaded with this function before.
+    """
     if data_dir is None:
         data_dir = os.path.realpath(
             os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
@@ -37,10 +60,46 @@ def download_data(data_dir: Optional[str] = None) -> None:
 
     logger.debug("Downloading data to %s", data_dir)
 
-    for url in URLS:
-        logger.debug("Downloading %s", url)
-        filename = os.path.join(data_dir, FILENAMES[url])
+    # The files are independent of each other, so they are downloaded
+    # in parallel and the total time is bound by the slowest download
+    with ThreadPoolExecutor(max_workers=len(URLS)) as executor:
+        list(
+            executor.map(
+                lambda url: _download_file(url, data_dir, only_if_modified), URLS
+            )
+        )
+
+
+def _download_file(url: str, data_dir: str, only_if_modified: bool = False) -> None:
+    logger.debug("Downloading %s", url)
+    filename = os.path.join(data_dir, FILENAMES[url])
+    request = urllib.request.Request(URLS[url])
+    if only_if_modified and os.path.exists(filename):
+        request.add_header(
+            "If-Modified-Since", formatdate(os.path.getmtime(filename), usegmt=True)
+        )
+
+    try:
+        response = urllib.request.urlopen(request, timeout=60)
+    except HTTPError as err:
+        if err.code == 304:
+            logger.debug("%s is not modified. Skipping download", filename)
+            return
+        raise
+
+    with response:
         if os.path.exists(filename):
             logger.warning("%s exists already. Backing up old data", filename)
             make_backup(filename)
-        urllib.request.urlretrieve(URLS[url], filename)
+        with open(filename, "wb") as fh:
+            shutil.copyfileobj(response, fh, CHUNK_SIZE)
+        last_modified = response.headers.get("Last-Modified")
+
+    if last_modified:
+        # Use the server timestamp for the next conditional request
+        try:
+            mtime = parsedate_to_datetime(last_modified).timestamp()
+        except (TypeError, ValueError):
+            logger.debug("Invalid Last-Modified header: %s", last_modified)
+            return
+        os.utime(filename, (mtime, mtime))
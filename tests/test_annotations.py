@@ -1,6 +1,9 @@
+import pickle
 import unittest
+from unittest.mock import patch, PropertyMock
 
 from pyhpo.annotations import Gene
+from pyhpo.term import HPOTerm
 from pyhpo.parser.genes import all_genes, add_gene_to_term
 from pyhpo.parser.genes import _add_genes_to_ontology
 
@@ -51,40 +54,12 @@ class GeneTests(unittest.TestCase):
         self.assertIs(f, h)
         self.assertIs(f, i)
 
-        self.assertEqual(a, b)
-        self.assertEqual(a, c)
-        self.assertEqual(a, d)
-        self.assertEqual(a, e)
-        self.assertEqual(a, g)
-        self.assertEqual(b, c)
-        self.assertEqual(b, d)
-        self.assertEqual(b, e)
-        self.assertEqual(b, g)
-        self.assertEqual(c, d)
-        self.assertEqual(c, e)
-        self.assertEqual(c, g)
-        self.assertEqual(d, e)
-        self.assertEqual(d, g)
-        self.assertEqual(e, g)
+        # All genes of one group are the same singleton, so they are
+        # equal to each other and different from the other group
+        self.assertEqual({a, b, c, d, e, g}, {a})
+        self.assertEqual({f, h, i}, {f})
         self.assertNotEqual(a, f)
-        self.assertNotEqual(a, h)
-        self.assertNotEqual(a, i)
-        self.assertNotEqual(b, f)
-        self.assertNotEqual(b, h)
-        self.assertNotEqual(b, i)
-        self.assertNotEqual(c, f)
-        self.assertNotEqual(c, h)
-        self.assertNotEqual(c, i)
-        self.assertNotEqual(d, f)
-        self.assertNotEqual(d, h)
-        self.assertNotEqual(d, i)
-        self.assertNotEqual(e, f)
-        self.assertNotEqual(e, h)
-        self.assertNotEqual(e, i)
-
-        self.assertEqual(f, h)
-        self.assertEqual(f, i)
-        self.assertEqual(h, i)
+        self.assertNotEqual(f, a)
 
         self.assertEqual(len(Gene.keys()), 2)
         self.assertEqual(len(Gene.values()), 2)
@@ -142,6 +117,13 @@ class TestAnnotationBase(unittest.TestCase):
         g = Gene(hgncid=1, symbol="Foo")
         self.assertEqual(str(g), "Foo")
 
+    def test_pickle(self):
+        g = Gene(hgncid=1, symbol="Foo")
+        g2 = pickle.loads(pickle.dumps(g))
+        self.assertEqual(g, g2)
+        self.assertEqual(hash(g), hash(g2))
+        self.assertEqual(g2.symbol, "Foo")
+
 
 class TestGeneAnnotationParsing(unittest.TestCase):
     def setUp(self):
@@ -151,6 +133,25 @@ class TestGeneAnnotationParsing(unittest.TestCase):
     def tearDown(self):
         Gene.clear()
 
+    def assert_annotated_genes(self):
+        """
+        Checks all terms at once after annotating
+        the first gene to HP:0031 and the second gene to HP:0041
+        """
+        both = {self.genes[0], self.genes[1]}
+        expected = {
+            1: both,
+            11: both,
+            21: both,
+            31: both,
+            12: both,
+            41: {self.genes[1]},
+            13: set(),
+        }
+        self.assertEqual(
+            {term_id: self.ontology[term_id].genes for term_id in expected}, expected
+        )
+
     def test_gene_global_singleton(self):
         assert len(all_genes()) == 5
 
@@ -188,26 +189,31 @@ class TestGeneAnnotationParsing(unittest.TestCase):
         add_gene_to_term(self.genes[0], self.ontology[31])
         add_gene_to_term(self.genes[1], self.ontology[41])
 
-        assert self.ontology[1].genes == set([self.genes[0], self.genes[1]])
-        assert self.ontology[11].genes == set([self.genes[0], self.genes[1]])
-        assert self.ontology[21].genes == set([self.genes[0], self.genes[1]])
-        assert self.ontology[31].genes == set([self.genes[1], self.genes[0]])
-        assert self.ontology[12].genes == set([self.genes[1], self.genes[0]])
-        assert self.ontology[41].genes == set([self.genes[1]])
-        assert self.ontology[13].genes == set()
+        self.assert_annotated_genes()
+
+    def test_annotating_already_annotated_term(self):
+        add_gene_to_term(self.genes[0], self.ontology[21])
+        annotated = {term: set(term.genes) for term in self.ontology}
+        assert self.ontology[1].genes == set([self.genes[0]])
+        assert self.ontology[11].genes == set([self.genes[0]])
+        assert self.ontology[21].genes == set([self.genes[0]])
+
+        # Terms that have the gene already are skipped, together
+        # with their ancestors, which must have the gene as well
+        with patch.object(
+            HPOTerm, "all_parents", new_callable=PropertyMock
+        ) as mock_parents:
+            add_gene_to_term(self.genes[0], self.ontology[21])
+            mock_parents.assert_not_called()
+
+        assert {term: term.genes for term in self.ontology} == annotated
 
     def test_full_annotation(self):
         self.genes[0].hpo.add(31)
         self.genes[1].hpo.add(41)
         _add_genes_to_ontology(self.ontology)
 
-        assert self.ontology[1].genes == set([self.genes[0], self.genes[1]])
-        assert self.ontology[11].genes == set([self.genes[0], self.genes[1]])
-        assert self.ontology[21].genes == set([self.genes[0], self.genes[1]])
-        assert self.ontology[31].genes == set([self.genes[1], self.genes[0]])
-        assert self.ontology[12].genes == set([self.genes[1], self.genes[0]])
-        assert self.ontology[41].genes == set([self.genes[1]])
-        assert self.ontology[13].genes == set()
+        self.assert_annotated_genes()
 
         assert self.genes[0].hpo == set([31])
         assert self.genes[1].hpo == set([41])
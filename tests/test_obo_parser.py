@@ -128,6 +128,17 @@ class TestBasic(unittest.TestCase):
             [],
         ) == ["Scalp hair loss"]
 
+    def test_synonym_parsing_escaped_quotes(self):
+        assert Converter.parse_synonym(
+            ['"The \\"Foo\\" syndrome" EXACT []'], "synonym", []
+        ) == ['The "Foo" syndrome']
+        assert Converter.parse_synonym(
+            ['"Ends with backslash\\\\" EXACT []'], "synonym", []
+        ) == ["Ends with backslash\\"]
+        assert Converter.parse_synonym(
+            ['"A \\\\ B \\"C\\"" EXACT []'], "synonym", []
+        ) == ['A \\ B "C"']
+
     def test_synonym_parsing_errors(self):
         with self.assertRaises(IndexError) as context:
             Converter.parse_synonym(["synonym: Scalp hair loss"], "synonym", [])
@@ -24,6 +24,27 @@ class Test_Simscore_registers(unittest.TestCase):
         assert res == 12
         mock_graphic.assert_called_once_with({}, {}, "omim", [])
 
+    def test_shared_dependencies_are_calculated_once(self):
+        mock_resnik = MagicMock(return_value=2)
+        mock_lin = MagicMock(return_value=3)
+        mock_rel = MagicMock(return_value=4)
+        mock_resnik.dependencies = []
+        mock_lin.dependencies = ["resnik"]
+        mock_rel.dependencies = ["resnik", "lin"]
+        self.simscore.register("resnik", MagicMock(return_value=mock_resnik))
+        self.simscore.register("lin", MagicMock(return_value=mock_lin))
+        self.simscore.register("rel", MagicMock(return_value=mock_rel))
+
+        res = self.simscore({}, {}, method="rel")
+        assert res == 4
+        mock_resnik.assert_called_once_with({}, {}, "omim", [])
+        mock_lin.assert_called_once_with({}, {}, "omim", [2])
+        mock_rel.assert_called_once_with({}, {}, "omim", [2, 3])
+
+        # The results are not kept across separate calls
+        self.simscore({}, {}, method="rel")
+        assert mock_resnik.call_count == 2
+
 
 if __name__ == "__main__":
     unittest.main()
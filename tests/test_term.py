@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from unittest.mock import patch
 
@@ -64,13 +65,60 @@ class TestTermInit(unittest.TestCase):
         self.term = HPOTerm(**parse_obo_section(TEST_HPO))
 
     def test_init(self):
-        self.assertIsNotNone(self.term._hash)
-        self.assertEqual(self.term._hash, hash(self.term))
-        self.assertEqual(hash(self.term), hash((self.term.index, self.term.name)))
+        self.assertEqual(hash(self.term), self.term.index)
+        self.assertEqual(int(self.term), self.term.index)
+
+    def test_equality(self):
+        other = HPOTerm(**parse_obo_section(TEST_HPO))
+        self.assertEqual(self.term, other)
+        self.assertEqual(len({self.term, other}), 1)
+        self.assertNotEqual(self.term, 4944)
+        self.assertNotEqual(self.term, None)
+        self.assertNotEqual(self.term, "HP:0004944")
+        self.assertIs(self.term.__eq__(4944), NotImplemented)
+
+    def test_ordering(self):
+        lower = HPOTerm(id="HP:0000118", name="Foo")
+        higher = HPOTerm(id="HP:0009145", name="Bar")
+        self.assertLess(lower, self.term)
+        self.assertLess(self.term, higher)
+        self.assertFalse(self.term < self.term)
+        self.assertEqual(sorted([higher, self.term, lower]), [lower, self.term, higher])
+        # Terms can also be compared with their integer index
+        self.assertLess(self.term, 4945)
+        self.assertFalse(self.term < 4944)
 
     def test_id(self):
         self.assertEqual(hash(self.term.index), 4944)
 
+    def test_str(self):
+        self.assertEqual(str(self.term), f"HP:0004944 | {self.term.name}")
+        self.term.name = "Foo"
+        self.assertEqual(str(self.term), "HP:0004944 | Foo")
+        other = self.term.model_copy(update={"name": "Bar"})
+        self.assertEqual(str(other), "HP:0004944 | Bar")
+
+    def test_repr(self):
+        self.term.name = "Foo"
+        self.assertTrue(
+            repr(self.term).startswith("HPOTerm(id='HP:0004944', name='Foo'")
+        )
+
+    def test_pickle(self):
+        term = pickle.loads(pickle.dumps(self.term))
+        self.assertEqual(term, self.term)
+        self.assertEqual(hash(term), hash(self.term))
+        self.assertEqual(term.parent_ids(), [2617, 9145])
+        self.assertEqual(repr(term), repr(self.term))
+
+    def test_duplicated_parents(self):
+        term = HPOTerm(
+            id="HP:0000002",
+            name="Foo",
+            is_a=["HP:0000001 ! Root", "HP:0000003", "HP:0000001 ! Root"],
+        )
+        self.assertEqual(term.parent_ids(), [1, 3])
+
 
 class TestSingleTermAttributes(unittest.TestCase):
     def setUp(self):
@@ -101,10 +149,10 @@ class TestSingleTermAttributes(unittest.TestCase):
             "UMLS:C0751003",
             "UMLS:C1290398",
         ]
-        assert term._is_a == [
+        assert term._is_a == (
             "HP:0002617 ! Dilatation",
             "HP:0009145 ! Abnormal cerebral artery morphology",
-        ]
+        )
         self.assertEqual(term.parent_ids(), [2617, 9145])
         self.assertEqual(term.hierarchy, ((term,),))
         self.assertEqual(term.toJSON().keys(), {"int", "id", "name"})
@@ -129,7 +177,7 @@ class TestSingleTermAttributes(unittest.TestCase):
         self.assertEqual(term.toJSON(verbose=True)["comment"], term.comment)
         self.assertEqual(term.toJSON(verbose=True)["synonym"], term.synonym)
         self.assertEqual(term.toJSON(verbose=True)["xref"], term.xref)
-        self.assertEqual(term.toJSON(verbose=True)["is_a"], term._is_a)
+        self.assertEqual(term.toJSON(verbose=True)["is_a"], list(term._is_a))
 
 
 class TestTermAnnotations(unittest.TestCase):
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from pyhpo.ontology import Ontology
+from pyhpo.term import HPOTerm
 from tests.mockontology import make_terms, tearDown
 from tests.mockontology import make_ontology_with_annotation
 from tests.mockontology import make_ontology
@@ -227,20 +228,30 @@ class TestOntologyTreeTraversal(unittest.TestCase):
             _ = self.child_1_2.shortest_path_to_parent(self.child_4)
         self.assertEqual(str(err.exception), "HP:0041 is not a parent of HP:0012")
 
-    @patch("pyhpo.term.sorted")
-    def test_the_impossible(self, mock_sorted):
+    def test_the_impossible(self):
         """
         I was not able to figure out an actual test case
         to test the exception handling in shortest_path_to_parent.
         So I made this contrived test case here.
         """
-        mock_sorted.return_value = []
+        # Pretend the cached distances are missing the parent
+        self.child_2_1.__dict__["_dist_to_ancestor"] = {}
         with self.assertRaises(RuntimeError) as err:
-            _ = self.child_1_1.shortest_path_to_parent(self.root)
+            _ = self.child_2_1.shortest_path_to_parent(self.root)
         self.assertEqual(
             str(err.exception), "Unable to determine path to parent term Test root"
         )
 
+    def test_shortest_path_to_self_and_direct_parent(self):
+        assert self.child_3.shortest_path_to_parent(self.child_3) == (
+            0,
+            (self.child_3,),
+        )
+        assert self.child_3.shortest_path_to_parent(self.child_1_2) == (
+            1,
+            (self.child_3, self.child_1_2),
+        )
+
     def test_path_to_other(self):
         path = self.child_1_1.path_to_other(self.root)
         assert path == (1, (self.child_1_1, self.root), 1, 0)
@@ -278,6 +289,11 @@ class TestOntologyTreeTraversal(unittest.TestCase):
             3,
         )
 
+    def test_path_to_other_unconnected(self):
+        unconnected = HPOTerm(id="HP:0099", name="Unconnected term")
+        with self.assertRaises(IndexError):
+            self.child_4.path_to_other(unconnected)
+
     def test_child_parent_checking(self):
         assert self.root.parent_of(self.child_1_1)
         assert self.root.parent_of(self.child_1_2)
@@ -457,6 +473,16 @@ class TestOntologyQueries(unittest.TestCase):
             self.terms.get_hpo_object(666666)
         assert str(err.exception) == "Unknown HPO term"
 
+    def test_terms_are_singletons(self):
+        term = self.terms[12]
+        self.assertIs(self.terms.get_hpo_object("Test child level 1-2"), term)
+        self.assertIs(self.terms.get_hpo_object("HP:00012"), term)
+        self.assertIs(self.terms.get_hpo_object(12), term)
+        self.assertIs(self.terms.match(term.name), term)
+        for parent in term.parents:
+            self.assertIs(self.terms[parent.index], parent)
+            self.assertIn(term, parent.children)
+
     def test_matching(self):
         self.assertEqual(self.terms.match(self.root.name), self.root)
         self.assertEqual(self.terms.match(self.child_1_1.name), self.child_1_1)
@@ -552,6 +578,15 @@ class TestOntologyQueries(unittest.TestCase):
         assert ontology[31] in ca
         assert len(ca) == 5
 
+    def test_topological_order(self):
+        ontology = make_ontology()
+
+        order = list(ontology._topological_order())
+        assert len(order) == len(ontology)
+        for term in order:
+            for parent in term.parents:
+                assert order.index(parent) < order.index(term)
+
     @unittest.skip("TODO")
     def test_loading_from_file(self):
         pass
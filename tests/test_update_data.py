@@ -0,0 +1,105 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from urllib.error import HTTPError
+
+from pyhpo import update_data
+
+
+class MockResponse(io.BytesIO):
+    def __init__(self, content: bytes, headers: dict):
+        super().__init__(content)
+        self.headers = headers
+
+
+def http_error(code: int) -> HTTPError:
+    return HTTPError(update_data.URLS["HPO_GENE"], code, "Error", {}, None)
+
+
+@patch("pyhpo.update_data.urllib.request.urlopen")
+class TestDownloadFile(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_dir = self.tmpdir.name
+        self.filename = os.path.join(self.data_dir, update_data.FILENAMES["HPO_GENE"])
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_existing_file(self):
+        with open(self.filename, "wb") as fh:
+            fh.write(b"old")
+        os.utime(self.filename, (1000000000, 1000000000))
+
+    def read_file(self):
+        with open(self.filename, "rb") as fh:
+            return fh.read()
+
+    def test_download(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(
+            b"new", {"Last-Modified": "Fri, 26 Apr 2024 10:00:00 GMT"}
+        )
+        update_data._download_file("HPO_GENE", self.data_dir)
+
+        self.assertEqual(self.read_file(), b"new")
+        self.assertEqual(os.path.getmtime(self.filename), 1714125600)
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual(request.full_url, update_data.URLS["HPO_GENE"])
+        self.assertIsNone(request.get_header("If-modified-since"))
+
+    def test_download_without_last_modified(self, mock_urlopen):
+        mock_urlopen.return_value = MockResponse(b"new", {})
+        update_data._download_file("HPO_GENE", self.data_dir)
+        self.assertEqual(self.read_file(), b"new")
+
+    def test_download_invalid_last_modified(self, mock_urlopen):
+        self.write_existing_file()
+        mock_urlopen.return_value = MockResponse(b"new", {"Last-Modified": "Foo"})
+        update_data._download_file("HPO_GENE", self.data_dir)
+
+        self.assertEqual(self.read_file(), b"new")
+        self.assertNotEqual(os.path.getmtime(self.filename), 1000000000)
+
+    def test_only_if_modified_header(self, mock_urlopen):
+        self.write_existing_file()
+        mock_urlopen.return_value = MockResponse(b"new", {})
+        update_data._download_file("HPO_GENE", self.data_dir, only_if_modified=True)
+
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual(
+            request.get_header("If-modified-since"), "Sun, 09 Sep 2001 01:46:40 GMT"
+        )
+        self.assertEqual(self.read_file(), b"new")
+
+    def test_not_modified(self, mock_urlopen):
+        self.write_existing_file()
+        mock_urlopen.side_effect = http_error(304)
+        update_data._download_file("HPO_GENE", self.data_dir, only_if_modified=True)
+
+        self.assertEqual(self.read_file(), b"old")
+        self.assertEqual(os.path.getmtime(self.filename), 1000000000)
+
+    def test_http_error(self, mock_urlopen):
+        self.write_existing_file()
+        mock_urlopen.side_effect = http_error(500)
+        with self.assertRaises(HTTPError) as context:
+            update_data._download_file("HPO_GENE", self.data_dir, only_if_modified=True)
+        self.assertEqual(context.exception.code, 500)
+        self.assertEqual(self.read_file(), b"old")
+
+    def test_download_data(self, mock_urlopen):
+        mock_urlopen.side_effect = lambda *args, **kwargs: MockResponse(b"new", {})
+        update_data.download_data(self.data_dir)
+
+        self.assertEqual(mock_urlopen.call_count, len(update_data.URLS))
+        self.assertEqual(
+            sorted(os.listdir(self.data_dir)),
+            sorted(update_data.FILENAMES.values()),
+        )
+
+    def test_download_data_raises(self, mock_urlopen):
+        mock_urlopen.side_effect = http_error(404)
+        with self.assertRaises(HTTPError):
+            update_data.download_data(self.data_dir)